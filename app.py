@@ -1,7 +1,9 @@
 import streamlit as st
 import os
+import uuid
 from datetime import datetime
 from src.conversation_manager import ConversationManager
+from src.session_store import get_session_store
 
 st.set_page_config(
     page_title="TalentScout Hiring Assistant",
@@ -42,8 +44,17 @@ st.markdown("""
 
 def initialize_session_state():
     """Initialize Streamlit session state variables"""
-    if 'conversation_manager' not in st.session_state:
-        st.session_state.conversation_manager = ConversationManager()
+    # The owner token stays server-side; the session id in the URL alone cannot open a conversation
+    if 'owner_token' not in st.session_state:
+        st.session_state.owner_token = uuid.uuid4().hex
+    
+    if 'session_id' not in st.session_state and 'pending_session_id' not in st.session_state:
+        requested = st.query_params.get("session")
+        
+        if requested and get_session_store().is_resumable(requested):
+            st.session_state.pending_session_id = requested
+        else:
+            start_new_session()
     
     if 'messages' not in st.session_state:
         st.session_state.messages = []
@@ -51,6 +62,52 @@ def initialize_session_state():
     if 'conversation_started' not in st.session_state:
         st.session_state.conversation_started = False
 
+def start_new_session():
+    """Create a fresh conversation for this browser session"""
+    session_id, _ = get_session_store().create_session(st.session_state.owner_token)
+    st.session_state.session_id = session_id
+    st.session_state.pop('pending_session_id', None)
+    st.session_state.messages = []
+    st.session_state.conversation_started = False
+    st.query_params["session"] = session_id
+
+def restore_messages(manager: ConversationManager):
+    """Rebuild chat messages for a candidate returning to an existing session"""
+    if manager.conversation_history or manager.conversation_stage != "greeting":
+        st.session_state.messages = [
+            {"role": "assistant", "content": manager.get_greeting_message()}
+        ] + list(manager.conversation_history)
+        st.session_state.conversation_started = True
+
+def get_conversation_manager() -> ConversationManager:
+    """Get this session's conversation manager, rehydrating it if it was evicted"""
+    return get_session_store().get(st.session_state.session_id, st.session_state.owner_token)
+
+def display_resume_prompt():
+    """Ask for the candidate's email before resuming a session opened from a link"""
+    st.subheader("🔐 Resume Your Screening")
+    st.write("This link belongs to an earlier screening session. To continue it, please confirm the email address you provided.")
+    
+    with st.form("resume_form"):
+        email = st.text_input("Email address")
+        resume = st.form_submit_button("Resume Screening", type="primary")
+    
+    if resume:
+        session_id = st.session_state.pending_session_id
+        manager = get_session_store().claim(session_id, st.session_state.owner_token, email)
+        
+        if manager is not None:
+            st.session_state.session_id = session_id
+            del st.session_state.pending_session_id
+            restore_messages(manager)
+            st.rerun()
+        else:
+            st.error("We couldn't verify that email address for this session.")
+    
+    if st.button("🆕 Start a New Screening"):
+        start_new_session()
+        st.rerun()
+
 def display_header():
     """Display the main header"""
     st.markdown("""
@@ -85,7 +142,8 @@ def display_sidebar():
         st.subheader("🎛️ Controls")
         
         if st.button("🔄 Reset Conversation", use_container_width=True):
-            st.session_state.conversation_manager.reset_conversation()
+            get_session_store().finalize(st.session_state.session_id)
+            get_conversation_manager().reset_conversation()
             st.session_state.messages = []
             st.session_state.conversation_started = False
             st.rerun()
@@ -94,7 +152,7 @@ def display_sidebar():
             st.markdown("---")
             st.subheader("📊 Progress")
             
-            stage = st.session_state.conversation_manager.conversation_stage
+            stage = get_conversation_manager().conversation_stage
             progress_map = {
                 "greeting": 0.2,
                 "collecting_info": 0.6,
@@ -126,7 +184,7 @@ def display_chat_interface():
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.button("🚀 Start Conversation", use_container_width=True, type="primary"):
-                greeting = st.session_state.conversation_manager.get_greeting_message()
+                greeting = get_conversation_manager().get_greeting_message()
                 st.session_state.messages.append(
                     {"role": "assistant", "content": greeting})
                 st.session_state.conversation_started = True
@@ -141,9 +199,18 @@ def display_chat_input():
             st.session_state.messages.append(
                 {"role": "user", "content": user_input})
 
+            placeholder = st.empty()
+
+            def show_partial_response(partial: str):
+                placeholder.markdown(f"""
+                <div class="assistant-message">
+                    <strong>Assistant:</strong> {partial}
+                </div>
+                """, unsafe_allow_html=True)
+
             try:
-                response = st.session_state.conversation_manager.process_message(
-                    user_input)
+                response = get_conversation_manager().process_message(
+                    user_input, on_update=show_partial_response)
                 st.session_state.messages.append(
                     {"role": "assistant", "content": response})
             except Exception as e:
@@ -156,7 +223,7 @@ def display_chat_input():
 def display_candidate_summary():
     """Display candidate information summary"""
     if st.session_state.conversation_started:
-        candidate_data = st.session_state.conversation_manager.candidate_data
+        candidate_data = get_conversation_manager().candidate_data
 
         if candidate_data:
             st.markdown("---")
@@ -183,7 +250,7 @@ def display_candidate_summary():
                     st.write(f"**Tech Stack:** {', '.join(candidate_data['tech_stack'])}")
             
             if st.button("📥 Export Conversation", use_container_width=True):
-                conversation_export = st.session_state.conversation_manager.export_conversation()
+                conversation_export = get_conversation_manager().export_conversation()
                 st.download_button(
                     label="💾 Download Conversation Data",
                     data=conversation_export,
@@ -196,16 +263,31 @@ def main():
     initialize_session_state()
     display_header()
     
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        display_chat_interface()
-        display_candidate_summary()
+    if 'pending_session_id' in st.session_state:
+        display_resume_prompt()
+        return
     
-    with col2:
-        display_sidebar()
+    if 'session_notice' in st.session_state:
+        st.info(st.session_state.pop('session_notice'))
     
-    display_chat_input()
+    # Pin the session for the whole run so the reaper cannot evict it mid-turn
+    with get_session_store().use(st.session_state.session_id, st.session_state.owner_token) as manager:
+        if manager is None:
+            if st.session_state.messages:
+                st.session_state.session_notice = "Your previous session has expired or was resumed elsewhere, so a new screening has been started."
+            start_new_session()
+            st.rerun()
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            display_chat_interface()
+            display_candidate_summary()
+        
+        with col2:
+            display_sidebar()
+        
+        display_chat_input()
     
     st.markdown("---")
     st.markdown("""
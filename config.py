@@ -16,6 +16,14 @@ VERSION = "1.0.0"
 MAX_CONVERSATION_HISTORY = 50
 CONVERSATION_TIMEOUT_MINUTES = 30
 
+# Session Store Settings
+MAX_ACTIVE_SESSIONS = 200
+SESSION_MEMORY_LIMIT_MB = 64
+SESSION_SWEEP_INTERVAL_SECONDS = 60
+SESSION_SNAPSHOT_DIR = "data/sessions"
+SESSION_SNAPSHOT_RETENTION_HOURS = 24
+SESSION_MAX_CLAIM_ATTEMPTS = 5
+
 # Validation Settings
 EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 PHONE_DIGITS = 10
@@ -24,4 +32,40 @@ MAX_EXPERIENCE_YEARS = 50
 
 # Technical Question Settings
 MIN_TECHNICAL_QUESTIONS = 3
-MAX_TECHNICAL_QUESTIONS = 5
\ No newline at end of file
+MAX_TECHNICAL_QUESTIONS = 5
+
+# Parallel question generation for large tech stacks, one request per category
+TECH_QUESTION_FANOUT_ENABLED = True
+TECH_QUESTION_FANOUT_MIN_TECHS = 4
+TECH_QUESTION_FANOUT_MIN_CATEGORIES = 2
+TECH_QUESTION_BRANCH_TIMEOUT_SECONDS = 10
+TECH_QUESTION_BRANCH_MAX_TOKENS = 300
+
+# Response Cache Settings
+RESPONSE_CACHE_ENABLED = True
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_TTL_SECONDS = 6 * 60 * 60
+RESPONSE_CACHE_SIMILARITY_THRESHOLD = 0.8
+RESPONSE_CACHE_SHINGLE_SIZE = 3
+RESPONSE_CACHE_NUM_PERMUTATIONS = 64
+RESPONSE_CACHE_MAX_WORDS = 12
+RESPONSE_CACHE_STAGES = ["greeting", "technical_questions"]
+# Outside seeded answers, only questions naming one of these process topics are cached
+RESPONSE_CACHE_PROCESS_TOPICS = {
+    "timed", "time", "limit", "long", "duration", "minutes", "later", "pause", "break",
+    "role", "position", "job", "company", "team", "tools", "google", "internet", "notes",
+    "screening", "interview", "process", "steps", "next", "results", "contact", "privacy"
+}
+
+# Admin-seeded canonical answers, keyed by conversation stage
+CANONICAL_RESPONSES = {
+    "greeting": {
+        "How long will this take?": "The screening usually takes about 5-10 minutes. Just say 'ready' whenever you'd like to begin!",
+        "What is this screening about?": "I'll collect some basic information about you and then ask a few technical questions based on your tech stack. Say 'ready' to get started!"
+    },
+    "technical_questions": {
+        "Is this timed?": "No, there's no time limit. Take as long as you need to answer the questions.",
+        "Can I answer later?": "These questions are part of this screening session, so please answer whenever you're ready before ending the conversation. There's no time limit.",
+        "Can I use Google?": "Please answer from your own knowledge and experience - we're interested in how you think about these problems, not a perfect answer."
+    }
+}
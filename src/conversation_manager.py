@@ -1,13 +1,20 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable
 import json
+import uuid
 from datetime import datetime
 from src.groq_client import GroqClient
+from src.response_cache import ResponseCache, get_response_cache
+from src.utils import group_tech_stack_by_category
+import config
 
 class ConversationManager:
     """Manages the conversation flow and candidate data collection"""
     
-    def __init__(self):
+    def __init__(self, response_cache: ResponseCache = None):
         self.groq_client = GroqClient()
+        if response_cache is None and config.RESPONSE_CACHE_ENABLED:
+            response_cache = get_response_cache()
+        self.response_cache = response_cache
         self.reset_conversation()
         
         self.required_fields = [
@@ -27,6 +34,7 @@ class ConversationManager:
 
     def reset_conversation(self):
         """Reset conversation state"""
+        self.conversation_id = uuid.uuid4().hex
         self.conversation_history = []
         self.candidate_data = {}
         self.current_field_index = 0
@@ -43,8 +51,11 @@ This should take about 5-10 minutes. Ready to get started?
 
 (You can type 'exit', 'quit', or 'bye' at any time to end our conversation)"""
 
-    def process_message(self, user_message: str) -> str:
-        """Process user message and return appropriate response"""
+    def process_message(self, user_message: str, on_update: Callable[[str], None] = None) -> str:
+        """Process user message and return appropriate response
+        
+        on_update, if given, receives partial responses while they are still being generated.
+        """
         if self.groq_client.check_conversation_end(user_message):
             return self.end_conversation()
 
@@ -53,7 +64,7 @@ This should take about 5-10 minutes. Ready to get started?
         if self.conversation_stage == "greeting":
             response = self.handle_greeting_response(user_message)
         elif self.conversation_stage == "collecting_info":
-            response = self.handle_info_collection(user_message)
+            response = self.handle_info_collection(user_message, on_update)
         elif self.conversation_stage == "technical_questions":
             response = self.handle_technical_questions(user_message)
         else:
@@ -69,10 +80,12 @@ This should take about 5-10 minutes. Ready to get started?
         if any(word in user_message.lower() for word in positive_responses):
             self.conversation_stage = "collecting_info"
             return f"Great! Let's begin. {self.field_prompts[self.required_fields[0]]}"
+        elif self.is_process_question(user_message):
+            return self.answer_process_question(user_message)
         else:
             return self.groq_client.get_response(user_message, self.conversation_history)
 
-    def handle_info_collection(self, user_message: str) -> str:
+    def handle_info_collection(self, user_message: str, on_update: Callable[[str], None] = None) -> str:
         """Handle information collection phase"""
         current_field = self.required_fields[self.current_field_index]
         
@@ -81,7 +94,7 @@ This should take about 5-10 minutes. Ready to get started?
             
             if self.current_field_index >= len(self.required_fields):
                 self.conversation_stage = "technical_questions"
-                return self.generate_technical_questions()
+                return self.generate_technical_questions(on_update)
             else:
                 next_field = self.required_fields[self.current_field_index]
                 return f"Thank you! {self.field_prompts[next_field]}"
@@ -137,27 +150,66 @@ This should take about 5-10 minutes. Ready to get started?
         
         return clarifications.get(field, "Could you please provide that information again?")
 
-    def generate_technical_questions(self) -> str:
+    def generate_technical_questions(self, on_update: Callable[[str], None] = None) -> str:
         """Generate technical questions based on tech stack"""
         if not self.technical_questions_generated:
             tech_stack = self.candidate_data.get("tech_stack", [])
-            questions = self.groq_client.generate_technical_questions(tech_stack)
             
-            response = f"""Perfect! I have all your information. Based on your tech stack ({', '.join(tech_stack)}), here are some technical questions for you:
-
-{questions}
-
-Please feel free to answer these questions. You can answer them one by one or all together, whichever you prefer.
-
-When you're done, just let me know and I'll wrap up our conversation."""
+            questions = None
+            if self.should_fan_out_questions(tech_stack):
+                questions = self.generate_technical_questions_fanout(tech_stack, on_update)
+            if not questions:
+                questions = self.groq_client.generate_technical_questions(tech_stack)
             
             self.technical_questions_generated = True
-            return response.strip()
+            return self.format_technical_questions(tech_stack, questions)
         else:
             return "Thank you for your responses! Is there anything else you'd like to add or clarify about your technical experience?"
 
+    def should_fan_out_questions(self, tech_stack: List[str]) -> bool:
+        """Check if the tech stack is large enough for per-category question generation"""
+        if not config.TECH_QUESTION_FANOUT_ENABLED or len(tech_stack) < config.TECH_QUESTION_FANOUT_MIN_TECHS:
+            return False
+        return len(group_tech_stack_by_category(tech_stack)) >= config.TECH_QUESTION_FANOUT_MIN_CATEGORIES
+
+    def generate_technical_questions_fanout(self, tech_stack: List[str], on_update: Callable[[str], None] = None) -> str:
+        """Generate questions concurrently per category, streaming partial results to on_update"""
+        questions = []
+        for category, new_questions in self.groq_client.stream_technical_questions(tech_stack):
+            questions.extend(new_questions)
+            # Hold back partial lists until they are certain to be kept in the final message
+            if on_update and len(questions) >= config.MIN_TECHNICAL_QUESTIONS:
+                partial = "\n".join(f"{i}. {question}" for i, question in enumerate(questions, 1))
+                on_update(self.format_technical_questions(tech_stack, partial, in_progress=True))
+        
+        # Too few questions: let the caller fall back to the single full request
+        if len(questions) < config.MIN_TECHNICAL_QUESTIONS:
+            return ""
+        
+        return "\n".join(f"{i}. {question}" for i, question in enumerate(questions, 1))
+
+    def format_technical_questions(self, tech_stack: List[str], questions: str, in_progress: bool = False) -> str:
+        """Format generated questions into the assistant message"""
+        if in_progress:
+            footer = "Generating more questions..."
+        else:
+            footer = """Please feel free to answer these questions. You can answer them one by one or all together, whichever you prefer.
+
+When you're done, just let me know and I'll wrap up our conversation."""
+        
+        response = f"""Perfect! I have all your information. Based on your tech stack ({', '.join(tech_stack)}), here are some technical questions for you:
+
+{questions}
+
+{footer}"""
+        
+        return response.strip()
+
     def handle_technical_questions(self, user_message: str) -> str:
         """Handle technical questions phase"""
+        if self.is_process_question(user_message):
+            return self.answer_process_question(user_message)
+
         if "technical_responses" not in self.candidate_data:
             self.candidate_data["technical_responses"] = []
         
@@ -171,6 +223,24 @@ When you're done, just let me know and I'll wrap up our conversation."""
             self.conversation_history
         )
 
+    def is_process_question(self, user_message: str) -> bool:
+        """Check if a message is a general process question whose answer doesn't depend on the candidate"""
+        if self.response_cache is None:
+            return False
+        return self.response_cache.is_eligible(user_message, self.conversation_stage, self.candidate_data)
+
+    def answer_process_question(self, user_message: str) -> str:
+        """Answer a process question from the response cache, falling back to a context-free API call"""
+        cached = self.response_cache.get(user_message, self.conversation_stage, self.candidate_data)
+        if cached is not None:
+            return cached
+
+        response = self.groq_client.answer_process_question(user_message)
+
+        if not self.groq_client.is_error_response(response):
+            self.response_cache.put(user_message, self.conversation_stage, response, self.candidate_data)
+        return response
+
     def end_conversation(self) -> str:
         """End the conversation gracefully"""
         self.conversation_stage = "ending"
@@ -186,6 +256,26 @@ If you have any questions in the meantime, feel free to reach out to our team di
 
 Have a great day! 👋"""
 
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Get serializable conversation state"""
+        return {
+            "conversation_id": self.conversation_id,
+            "candidate_data": self.candidate_data,
+            "conversation_history": self.conversation_history,
+            "current_field_index": self.current_field_index,
+            "conversation_stage": self.conversation_stage,
+            "technical_questions_generated": self.technical_questions_generated
+        }
+
+    def restore_snapshot(self, snapshot: Dict[str, Any]):
+        """Restore conversation state from a snapshot"""
+        self.conversation_id = snapshot.get("conversation_id", self.conversation_id)
+        self.candidate_data = snapshot.get("candidate_data", {})
+        self.conversation_history = snapshot.get("conversation_history", [])
+        self.current_field_index = snapshot.get("current_field_index", 0)
+        self.conversation_stage = snapshot.get("conversation_stage", "greeting")
+        self.technical_questions_generated = snapshot.get("technical_questions_generated", False)
+
     def get_candidate_summary(self) -> Dict[str, Any]:
         """Get summary of collected candidate data"""
         return {
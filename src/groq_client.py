@@ -1,10 +1,20 @@
 import os
-from typing import Dict, List
+import math
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Iterator, Tuple
 from groq import Groq
 from dotenv import load_dotenv
+import config
+from src.utils import group_tech_stack_by_category, parse_numbered_questions, normalize_question
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+ERROR_RESPONSE_PREFIX = "I apologize, but I'm experiencing technical difficulties."
+
 class GroqClient:
     """Client for interacting with Groq API for hiring assistant functionality"""
     
@@ -42,7 +52,27 @@ class GroqClient:
             return response.choices[0].message.content
             
         except Exception as e:
-            return f"I apologize, but I'm experiencing technical difficulties. Please try again. Error: {str(e)}"
+            return f"{ERROR_RESPONSE_PREFIX} Please try again. Error: {str(e)}"
+
+    def answer_process_question(self, question: str) -> str:
+        """Answer a general question about the screening process without any candidate context"""
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": """You are TalentScout's AI Hiring Assistant. A candidate in an initial technical screening 
+                    asked a general question about the screening process. Answer it briefly and politely in 1-3 sentences. 
+                    Do not address the candidate by name or refer to any of their details, answers, or specific questions."""},
+                    {"role": "user", "content": question}
+                ],
+                temperature=0.3,
+                max_tokens=200
+            )
+            
+            return response.choices[0].message.content
+            
+        except Exception as e:
+            return f"{ERROR_RESPONSE_PREFIX} Please try again. Error: {str(e)}"
 
     def generate_technical_questions(self, tech_stack: List[str]) -> str:
         """Generate technical questions based on candidate's tech stack"""
@@ -67,6 +97,108 @@ class GroqClient:
         except Exception as e:
             return f"Unable to generate technical questions at the moment. Error: {str(e)}"
 
+    def generate_category_questions(self, category: str, techs: List[str], num_questions: int,
+                                    timeout: float = None) -> List[str]:
+        """Generate a short list of questions for a single tech category"""
+        prompt = f"""Category: {category}. Technologies: {", ".join(techs)}
+        Generate exactly {num_questions} technical screening question(s) for these technologies. 
+        Requirements: practical, job-relevant, appropriate difficulty level, numbered list, questions only."""
+        
+        # No retries, so a branch never outlives the fan-out deadline
+        response = self.client.with_options(max_retries=0).chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "You are an expert technical interviewer creating screening questions."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.8,
+            max_tokens=config.TECH_QUESTION_BRANCH_MAX_TOKENS,
+            timeout=timeout
+        )
+        
+        return parse_numbered_questions(response.choices[0].message.content)[:num_questions]
+
+    def stream_technical_questions(self, tech_stack: List[str]) -> Iterator[Tuple[str, List[str]]]:
+        """Generate questions concurrently per tech category, yielding each category's new questions as it completes
+        
+        All branches start together and share one deadline. A reserve branch covering the whole stack runs
+        alongside them and is only used when the categories yield fewer than MIN_TECHNICAL_QUESTIONS.
+        """
+        max_questions = config.MAX_TECHNICAL_QUESTIONS
+        min_questions = config.MIN_TECHNICAL_QUESTIONS
+        timeout = config.TECH_QUESTION_BRANCH_TIMEOUT_SECONDS
+        groups = list(group_tech_stack_by_category(tech_stack).items())
+        if not groups:
+            return
+        
+        # Fold the smallest categories into one branch rather than dropping them
+        if len(groups) > max_questions:
+            overflow = groups[max_questions - 1:]
+            groups = groups[:max_questions - 1] + [(
+                " / ".join(category for category, _ in overflow),
+                [tech for _, techs in overflow for tech in techs]
+            )]
+        
+        per_branch = math.ceil(max_questions / len(groups))
+        seen = set()
+        total = 0
+        
+        def take_new(questions: List[str]) -> List[str]:
+            nonlocal total
+            new_questions = []
+            for question in questions:
+                key = normalize_question(question)
+                if key and key not in seen and total < max_questions:
+                    seen.add(key)
+                    new_questions.append(question)
+                    total += 1
+            return new_questions
+        
+        def result_of(future, name: str) -> List[str]:
+            try:
+                return future.result()
+            except Exception as e:
+                logger.warning("Question generation for %s failed: %s", name, e)
+                return []
+        
+        # One worker per branch plus the reserve, so every request starts immediately
+        executor = ThreadPoolExecutor(max_workers=len(groups) + 1)
+        deadline = time.monotonic() + timeout
+        try:
+            futures = {
+                executor.submit(self.generate_category_questions, category, techs, per_branch, timeout): category
+                for category, techs in groups
+            }
+            reserve = executor.submit(self.generate_category_questions, "General", tech_stack, min_questions, timeout)
+            
+            pending = set(futures)
+            while pending and total < max_questions:
+                done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+                if not done:
+                    for future in pending:
+                        logger.warning("Question generation for %s timed out after %ss", futures[future], timeout)
+                    break
+                
+                for future in done:
+                    new_questions = take_new(result_of(future, futures[future]))
+                    if new_questions:
+                        yield futures[future], new_questions
+            
+            if total < min_questions:
+                wait([reserve], timeout=max(0, deadline - time.monotonic()))
+                if reserve.done():
+                    new_questions = take_new(result_of(reserve, "General")[:min_questions - total])
+                    if new_questions:
+                        yield "General", new_questions
+                else:
+                    logger.warning("Reserve question generation timed out after %ss", timeout)
+        finally:
+            executor.shutdown(wait=False)
+
+    def is_error_response(self, response: str) -> bool:
+        """Check if a response is an API error fallback message"""
+        return response.startswith(ERROR_RESPONSE_PREFIX)
+
     def check_conversation_end(self, message: str) -> bool:
         """Check if user wants to end the conversation"""
         end_keywords = ["bye", "goodbye", "exit", "quit", "end", "stop", "finish", "done"]
@@ -0,0 +1,295 @@
+import re
+import time
+import zlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import config
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_QUESTION_STARTERS = (
+    "is", "are", "can", "could", "do", "does", "how", "what", "whats",
+    "when", "where", "which", "who", "why", "will", "would", "should", "may"
+)
+_PERSONAL_WORDS = {"my", "mine", "myself", "im", "ive", "id"}
+# Words that carry no meaning for near-duplicate matching; negations are deliberately absent
+_STOP_WORDS = {
+    "a", "an", "the", "is", "are", "am", "be", "this", "that", "it", "its", "there",
+    "i", "we", "you", "to", "of", "for", "in", "on", "at", "do", "does", "can",
+    "could", "will", "would", "should", "may", "please", "any", "just", "so"
+}
+# Words that point back at earlier turns or at the candidate, so the reply depends on context
+_FOLLOW_UP_WORDS = {
+    "i", "me", "that", "those", "last", "previous", "above", "earlier", "again", "repeat",
+    "right", "correct", "wrong", "mean", "meant", "explain", "question", "questions"
+}
+_FOLLOW_UP_PATTERN = re.compile(r'\b(this one|that one|q\d+)\b')
+_EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_DIGIT_RUN_PATTERN = re.compile(r'\d{3,}')
+
+
+def normalize_message(message: str) -> str:
+    """Normalize a message for cache keying"""
+    text = message.lower().strip().replace("'", "")
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+
+def content_words(normalized: str) -> frozenset:
+    """Get the meaningful words of a normalized message, with plurals folded"""
+    words = set()
+    for word in normalized.split():
+        if word in _STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.add(word)
+    return frozenset(words)
+
+
+def mentions_candidate_data(text: str, candidate_data: Dict[str, Any] = None) -> bool:
+    """Check if text contains any string value collected from the candidate"""
+    padded = f" {normalize_message(text)} "
+    for value in (candidate_data or {}).values():
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if isinstance(item, str) and len(item.strip()) > 1:
+                if f" {normalize_message(item)} " in padded:
+                    return True
+    return False
+
+
+class ResponseCache:
+    """Similarity-keyed LRU cache for context-free assistant replies"""
+
+    def __init__(self, max_entries: int = None, ttl_seconds: int = None,
+                 similarity_threshold: float = None, shingle_size: int = None,
+                 num_permutations: int = None):
+        self.max_entries = max_entries if max_entries is not None else config.RESPONSE_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.RESPONSE_CACHE_TTL_SECONDS
+        self.similarity_threshold = similarity_threshold if similarity_threshold is not None \
+            else config.RESPONSE_CACHE_SIMILARITY_THRESHOLD
+        self.shingle_size = shingle_size if shingle_size is not None else config.RESPONSE_CACHE_SHINGLE_SIZE
+        self.num_permutations = num_permutations if num_permutations is not None \
+            else config.RESPONSE_CACHE_NUM_PERMUTATIONS
+
+        # Fixed coefficients keep signatures stable across processes
+        self._permutations = [
+            (zlib.crc32(f"a{i}".encode()) | 1, zlib.crc32(f"b{i}".encode()))
+            for i in range(self.num_permutations)
+        ]
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._seeded: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset hit-rate counters"""
+        self.stats = {
+            "exact_hits": 0,
+            "similar_hits": 0,
+            "misses": 0,
+            "rejected": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0
+        }
+
+    def is_eligible(self, message: str, stage: str, candidate_data: Dict[str, Any] = None) -> bool:
+        """Check whether the reply to a message is independent of personal context
+        
+        Seeded canonical questions and their near-duplicates are always eligible. During technical
+        questions nothing else is, so answers and follow-ups are never mistaken for process questions.
+        Elsewhere a question must name a process topic and must not point back at earlier turns.
+        """
+        if stage not in config.RESPONSE_CACHE_STAGES:
+            return False
+
+        normalized = normalize_message(message)
+        words = normalized.split()
+        if not words or len(words) > config.RESPONSE_CACHE_MAX_WORDS:
+            return False
+        if _PERSONAL_WORDS.intersection(words):
+            return False
+        if _EMAIL_PATTERN.search(message) or _DIGIT_RUN_PATTERN.search(message):
+            return False
+        if mentions_candidate_data(message, candidate_data):
+            return False
+
+        with self._lock:
+            if self._find_match(normalized, stage, [self._seeded]):
+                return True
+        if stage == "technical_questions":
+            return False
+
+        if not (message.strip().endswith("?") or words[0] in _QUESTION_STARTERS):
+            return False
+        if _FOLLOW_UP_WORDS.intersection(words) or _FOLLOW_UP_PATTERN.search(normalized):
+            return False
+        return bool(config.RESPONSE_CACHE_PROCESS_TOPICS.intersection(words))
+
+    def get(self, message: str, stage: str, candidate_data: Dict[str, Any] = None) -> Optional[str]:
+        """Look up a cached reply by exact or near-duplicate message"""
+        if not self.is_eligible(message, stage, candidate_data):
+            with self._lock:
+                self.stats["rejected"] += 1
+            return None
+
+        normalized = normalize_message(message)
+        key = (stage, normalized)
+
+        with self._lock:
+            self._expire()
+
+            match = self._find_match(normalized, stage, [self._seeded, self._entries])
+            if match is None:
+                self.stats["misses"] += 1
+                return None
+
+            match_key, entry = match
+            self._mark_hit(match_key, entry)
+            self.stats["exact_hits" if match_key == key else "similar_hits"] += 1
+            return entry["response"]
+
+    def put(self, message: str, stage: str, response: str, candidate_data: Dict[str, Any] = None) -> bool:
+        """Store a reply if the message is eligible for caching
+        
+        The reply must come from a call made without conversation history or candidate data.
+        """
+        if not response or not self.is_eligible(message, stage, candidate_data):
+            return False
+        if mentions_candidate_data(response, candidate_data):
+            with self._lock:
+                self.stats["rejected"] += 1
+            return False
+
+        normalized = normalize_message(message)
+        key = (stage, normalized)
+
+        with self._lock:
+            if key in self._seeded:
+                return False
+            self._entries[key] = self._make_entry(normalized, response)
+            self._entries.move_to_end(key)
+            self.stats["stores"] += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return True
+
+    def seed(self, message: str, stage: str, response: str):
+        """Add an admin-provided canonical answer that never expires or gets evicted"""
+        normalized = normalize_message(message)
+        with self._lock:
+            self._seeded[(stage, normalized)] = self._make_entry(normalized, response)
+
+    def clear(self):
+        """Remove all learned entries, keeping seeded answers"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit-rate metrics"""
+        hits = self.stats["exact_hits"] + self.stats["similar_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hits": hits,
+            "lookups": lookups,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "seeded_entries": len(self._seeded)
+        }
+
+    def _make_entry(self, normalized: str, response: str) -> Dict[str, Any]:
+        """Build a cache entry with its MinHash signature"""
+        return {
+            "response": response,
+            "signature": self._signature(normalized),
+            "content_words": content_words(normalized),
+            "created_at": time.time(),
+            "hits": 0
+        }
+
+    def _find_match(self, normalized: str, stage: str,
+                    pools: List[Dict[Tuple[str, str], Dict[str, Any]]]) -> Optional[Tuple[Tuple[str, str], Dict[str, Any]]]:
+        """Find an exact or near-duplicate entry; caller must hold the lock"""
+        key = (stage, normalized)
+        for pool in pools:
+            if key in pool:
+                return key, pool[key]
+
+        signature = self._signature(normalized)
+        words = content_words(normalized)
+        best, best_score = None, 0.0
+        for pool in pools:
+            for entry_key, entry in pool.items():
+                # Near-duplicates may only differ in filler words, so "not timed" never matches "timed"
+                if entry_key[0] != stage or entry["content_words"] != words:
+                    continue
+                score = self._similarity(signature, entry["signature"])
+                if score > best_score:
+                    best, best_score = (entry_key, entry), score
+
+        if best and best_score >= self.similarity_threshold:
+            return best
+        return None
+
+    def _mark_hit(self, key: Tuple[str, str], entry: Dict[str, Any]):
+        """Record a hit and refresh LRU position"""
+        entry["hits"] += 1
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+    def _expire(self):
+        """Drop learned entries older than the TTL"""
+        if not self.ttl_seconds:
+            return
+        cutoff = time.time() - self.ttl_seconds
+        expired = [key for key, entry in self._entries.items() if entry["created_at"] < cutoff]
+        for key in expired:
+            del self._entries[key]
+        self.stats["expirations"] += len(expired)
+
+    def _shingles(self, normalized: str) -> List[int]:
+        """Hash character n-grams of a normalized message"""
+        text = f" {normalized} "
+        if len(text) <= self.shingle_size:
+            grams = {text}
+        else:
+            grams = {text[i:i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1)}
+        return [zlib.crc32(gram.encode()) for gram in grams]
+
+    def _signature(self, normalized: str) -> List[int]:
+        """Compute the MinHash signature of a normalized message"""
+        shingles = self._shingles(normalized)
+        return [
+            min(((a * shingle + b) % _MERSENNE_PRIME) & _MAX_HASH for shingle in shingles)
+            for a, b in self._permutations
+        ]
+
+    @staticmethod
+    def _similarity(signature_a: List[int], signature_b: List[int]) -> float:
+        """Estimate Jaccard similarity from two MinHash signatures"""
+        matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+        return matches / len(signature_a)
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache, seeded with canonical answers"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+            for stage, answers in config.CANONICAL_RESPONSES.items():
+                for message, response in answers.items():
+                    _shared_cache.seed(message, stage, response)
+        return _shared_cache
@@ -0,0 +1,371 @@
+import os
+import re
+import gzip
+import hmac
+import json
+import hashlib
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import config
+from src.conversation_manager import ConversationManager
+from src.utils import save_candidate_data
+
+logger = logging.getLogger(__name__)
+
+_SESSION_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+
+class SessionStore:
+    """Holds active conversations, spilling idle ones to compressed snapshots on disk
+
+    Each session belongs to an owner token that never leaves the server-side Streamlit
+    session. The session id alone is not enough to read a conversation: a different
+    owner has to claim it with the email address the candidate provided.
+    """
+
+    def __init__(self, snapshot_dir: str = None, idle_timeout_minutes: float = None,
+                 max_sessions: int = None, max_memory_mb: float = None):
+        self.snapshot_dir = snapshot_dir or config.SESSION_SNAPSHOT_DIR
+        self.idle_timeout_seconds = (idle_timeout_minutes or config.CONVERSATION_TIMEOUT_MINUTES) * 60
+        self.max_sessions = max_sessions or config.MAX_ACTIVE_SESSIONS
+        self.max_memory_bytes = (max_memory_mb or config.SESSION_MEMORY_LIMIT_MB) * 1024 * 1024
+
+        # Only in-memory bookkeeping happens under the lock; disk I/O and serialization happen outside it
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._spilling: Dict[str, Dict[str, Any]] = {}
+        self._stop_event = threading.Event()
+        self._reaper = None
+        self.stats = {"evicted": 0, "rehydrated": 0, "finalized": 0, "pruned": 0}
+
+    def create_session(self, owner: str) -> Tuple[str, ConversationManager]:
+        """Start a new conversation and return its session id and manager"""
+        session_id = uuid.uuid4().hex
+        manager = ConversationManager()
+        size, digest = self.fingerprint(manager)
+        with self._lock:
+            self._sessions[session_id] = self.make_entry(manager, owner, size, digest)
+        return session_id, manager
+
+    def get(self, session_id: str, owner: str) -> Optional[ConversationManager]:
+        """Get a session's manager, rehydrating it from disk if it was evicted"""
+        entry = self.load(session_id)
+        if entry is None:
+            return None
+
+        with self._lock:
+            if entry["owner"] != owner:
+                return None
+            entry["last_activity"] = time.time()
+            if session_id in self._sessions:
+                self._sessions.move_to_end(session_id)
+            return entry["manager"]
+
+    @contextmanager
+    def use(self, session_id: str, owner: str) -> Iterator[Optional[ConversationManager]]:
+        """Pin a session for the duration of a request so the reaper cannot evict it"""
+        manager = self.acquire(session_id, owner)
+        try:
+            yield manager
+        finally:
+            if manager is not None:
+                self.release(session_id)
+
+    def acquire(self, session_id: str, owner: str) -> Optional[ConversationManager]:
+        """Pin a session, rehydrating it if needed"""
+        for _ in range(3):
+            entry = self.load(session_id)
+            if entry is None:
+                return None
+
+            with self._lock:
+                # Evicted again between loading and pinning; try once more
+                if self._sessions.get(session_id) is not entry:
+                    continue
+                if entry["owner"] != owner:
+                    return None
+                entry["in_use"] += 1
+                entry["last_activity"] = time.time()
+                self._sessions.move_to_end(session_id)
+                return entry["manager"]
+        return None
+
+    def release(self, session_id: str):
+        """Unpin a session after a request, marking it changed if its state differs from the last save"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return
+            entry["in_use"] = max(0, entry["in_use"] - 1)
+            entry["last_activity"] = time.time()
+            self._sessions.move_to_end(session_id)
+
+        size, digest = self.fingerprint(entry["manager"])
+        with self._lock:
+            entry["size"] = size
+            if digest is None or digest != entry["saved_digest"]:
+                entry["dirty"] = True
+
+    def claim(self, session_id: str, owner: str, email: str) -> Optional[ConversationManager]:
+        """Transfer a session to a new owner who knows the candidate's email address"""
+        entry = self.load(session_id)
+        if entry is None:
+            return None
+
+        with self._lock:
+            if entry["failed_claims"] >= config.SESSION_MAX_CLAIM_ATTEMPTS:
+                return None
+            stored_email = entry["manager"].candidate_data.get("email")
+            if not stored_email or not hmac.compare_digest(
+                    stored_email.strip().lower().encode(), email.strip().lower().encode()):
+                entry["failed_claims"] += 1
+                return None
+            entry["owner"] = owner
+            entry["last_activity"] = time.time()
+            return entry["manager"]
+
+    def is_resumable(self, session_id: str) -> bool:
+        """Check if a session exists and can be claimed with the candidate's email"""
+        entry = self.load(session_id)
+        if entry is None:
+            return False
+        with self._lock:
+            return bool(entry["manager"].candidate_data.get("email")) and \
+                entry["failed_claims"] < config.SESSION_MAX_CLAIM_ATTEMPTS
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session's entry, rehydrating it from its snapshot if needed"""
+        if not session_id or not _SESSION_ID_PATTERN.match(session_id):
+            return None
+
+        with self._lock:
+            if session_id in self._sessions:
+                return self._sessions[session_id]
+            if session_id in self._spilling:
+                # Reclaimed while its snapshot is being written; the writer discards the file
+                entry = self._spilling.pop(session_id)
+                self._sessions[session_id] = entry
+                return entry
+
+        path = self.snapshot_path(session_id)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read session snapshot %s: %s", path, e)
+            return None
+
+        manager = ConversationManager()
+        manager.restore_snapshot(snapshot["conversation"])
+        size, digest = self.fingerprint(manager)
+
+        with self._lock:
+            if session_id in self._sessions:
+                return self._sessions[session_id]
+            entry = self.make_entry(manager, snapshot.get("owner"), size, digest)
+            entry["failed_claims"] = snapshot.get("failed_claims", 0)
+            self._sessions[session_id] = entry
+            self.stats["rehydrated"] += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return entry
+
+    def sweep(self) -> int:
+        """Evict idle sessions, then least recently used ones over the count or memory ceiling"""
+        with self._lock:
+            cutoff = time.time() - self.idle_timeout_seconds
+            victims = {
+                sid for sid, entry in self._sessions.items()
+                if entry["in_use"] == 0 and entry["last_activity"] < cutoff
+            }
+
+            count = len(self._sessions) - len(victims)
+            total_size = sum(entry["size"] for sid, entry in self._sessions.items() if sid not in victims)
+            for sid, entry in self._sessions.items():
+                if count <= self.max_sessions and total_size <= self.max_memory_bytes:
+                    break
+                if sid in victims or entry["in_use"]:
+                    continue
+                victims.add(sid)
+                count -= 1
+                total_size -= entry["size"]
+
+            spilled = self.detach(list(victims))
+
+        for sid, entry in spilled:
+            self.spill(sid, entry)
+
+        self.prune_snapshots()
+        return len(spilled)
+
+    def evict(self, session_id: str) -> bool:
+        """Evict a single session unless it is in use"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or entry["in_use"]:
+                return False
+            spilled = self.detach([session_id])
+
+        for sid, entry in spilled:
+            self.spill(sid, entry)
+        return True
+
+    def detach(self, session_ids: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Move sessions from memory to the spilling set; caller must hold the lock"""
+        detached = []
+        for sid in session_ids:
+            entry = self._sessions.pop(sid)
+            self._spilling[sid] = entry
+            detached.append((sid, entry))
+        return detached
+
+    def spill(self, session_id: str, entry: Dict[str, Any]):
+        """Finalize a detached session if needed, then write its snapshot to disk"""
+        manager = entry["manager"]
+        path = self.snapshot_path(session_id)
+        try:
+            if entry["dirty"]:
+                self.finalize_entry(entry)
+
+            snapshot = {
+                "session_id": session_id,
+                "owner": entry["owner"],
+                "last_activity": entry["last_activity"],
+                "failed_claims": entry["failed_claims"],
+                "conversation": manager.to_snapshot()
+            }
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning("Could not spill session %s, keeping it in memory: %s", session_id, e)
+            with self._lock:
+                if self._spilling.get(session_id) is entry:
+                    del self._spilling[session_id]
+                    self._sessions[session_id] = entry
+            return
+
+        with self._lock:
+            if self._spilling.get(session_id) is entry:
+                del self._spilling[session_id]
+                self.stats["evicted"] += 1
+            elif session_id in self._sessions and os.path.exists(path):
+                # The candidate came back while the snapshot was being written
+                os.remove(path)
+
+    def finalize(self, session_id: str):
+        """Save a session's candidate data now, e.g. before its conversation is reset"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+        if entry is not None:
+            self.finalize_entry(entry)
+
+    def finalize_entry(self, entry: Dict[str, Any]):
+        """Save candidate data for a conversation that reached technical questions"""
+        manager = entry["manager"]
+        _, digest = self.fingerprint(manager)
+
+        if manager.technical_questions_generated:
+            # One file per conversation, overwritten with the latest state on every save
+            save_candidate_data(manager.get_candidate_summary(), f"data/candidate_{manager.conversation_id}.json")
+
+        # Only cleared once the save succeeded, so a failed save is retried on the next eviction
+        with self._lock:
+            entry["dirty"] = False
+            entry["saved_digest"] = digest
+            if manager.technical_questions_generated:
+                self.stats["finalized"] += 1
+
+    def prune_snapshots(self):
+        """Delete snapshots older than the retention period"""
+        if not os.path.exists(self.snapshot_dir):
+            return
+
+        cutoff = time.time() - config.SESSION_SNAPSHOT_RETENTION_HOURS * 60 * 60
+        for filename in os.listdir(self.snapshot_dir):
+            path = os.path.join(self.snapshot_dir, filename)
+            try:
+                if filename.endswith(".json.gz") and os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    with self._lock:
+                        self.stats["pruned"] += 1
+            except OSError:
+                pass
+
+    def make_entry(self, manager: ConversationManager, owner: str, size: int = 0,
+                   saved_digest: str = None) -> Dict[str, Any]:
+        """Build the in-memory record for a session"""
+        return {
+            "manager": manager,
+            "owner": owner,
+            "last_activity": time.time(),
+            "in_use": 0,
+            "dirty": False,
+            "size": size,
+            "saved_digest": saved_digest,
+            "failed_claims": 0
+        }
+
+    def snapshot_path(self, session_id: str) -> str:
+        """Get the snapshot file path for a session"""
+        return os.path.join(self.snapshot_dir, f"{session_id}.json.gz")
+
+    def fingerprint(self, manager: ConversationManager) -> Tuple[int, Optional[str]]:
+        """Estimate a session's memory footprint and hash its state from one serialization"""
+        try:
+            serialized = json.dumps(manager.to_snapshot(), sort_keys=True)
+        except (TypeError, ValueError, RuntimeError):
+            return 0, None
+        return len(serialized), hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+    def start_reaper(self, interval_seconds: float = None):
+        """Start a background thread that periodically sweeps idle sessions"""
+        interval = interval_seconds or config.SESSION_SWEEP_INTERVAL_SECONDS
+        if self._reaper and self._reaper.is_alive():
+            return
+
+        def run():
+            while not self._stop_event.wait(interval):
+                try:
+                    self.sweep()
+                except Exception as e:
+                    logger.warning("Session sweep failed: %s", e)
+
+        self._stop_event.clear()
+        self._reaper = threading.Thread(target=run, name="session-reaper", daemon=True)
+        self._reaper.start()
+
+    def stop_reaper(self):
+        """Stop the background reaper thread"""
+        self._stop_event.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session store metrics"""
+        with self._lock:
+            return {**self.stats, "active_sessions": len(self._sessions)}
+
+
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """Get the process-wide session store, starting its reaper on first use"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SessionStore()
+            _shared_store.start_reaper()
+        return _shared_store
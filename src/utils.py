@@ -1,5 +1,6 @@
 import json
 import os
+import re
 from datetime import datetime
 from typing import Dict, List, Any
 
@@ -77,6 +78,29 @@ def validate_tech_stack(tech_stack: List[str]) -> Dict[str, Any]:
         "total_count": len(validated) + len(unknown)
     }
 
+def group_tech_stack_by_category(tech_stack: List[str]) -> Dict[str, List[str]]:
+    """Group tech stack into categories, largest first, with unknown techs under 'Other'"""
+    tech_validation = validate_tech_stack(tech_stack)
+    groups = dict(tech_validation['categorized'])
+    
+    if tech_validation['unknown']:
+        groups["Other"] = tech_validation['unknown']
+    
+    return dict(sorted(groups.items(), key=lambda item: len(item[1]), reverse=True))
+
+def parse_numbered_questions(text: str) -> List[str]:
+    """Extract questions from a numbered list in model output"""
+    questions = []
+    for line in text.splitlines():
+        match = re.match(r'^\s*\**\s*\d+[.)]\s*\**\s*(.+?)\s*\**\s*$', line)
+        if match:
+            questions.append(match.group(1).strip())
+    return questions
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for deduplication"""
+    return re.sub(r'\W+', ' ', question.lower()).strip()
+
 def generate_candidate_report(candidate_data: Dict[str, Any]) -> str:
     """Generate a formatted candidate report"""
     report = []
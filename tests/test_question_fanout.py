@@ -0,0 +1,128 @@
+import os
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import config
+from src.groq_client import GroqClient
+from src.conversation_manager import ConversationManager
+
+
+class FakeCompletions:
+    """Stand-in for the Groq chat completions API"""
+
+    def __init__(self, delays=None, failing=None):
+        self.delays = delays or {}
+        self.failing = failing or set()
+        self.prompts = []
+
+    def create(self, model, messages, timeout=None, **kwargs):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        if prompt.startswith("Category:"):
+            category = prompt.split("Category: ")[1].split(". Technologies")[0]
+            if category in self.failing:
+                raise RuntimeError("invalid API key")
+            time.sleep(self.delays.get(category, 0))
+            if category == "General":
+                content = "1. How do you debug production issues?\n2. How do you review code?\n3. How do you test?"
+            else:
+                content = f"1. **What is a key feature of {category}?**\n2. How would you use {category} at scale?"
+        else:
+            content = "1. Full question one\n2. Full question two\n3. Full question three"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeGroq:
+    """Stand-in for the Groq SDK client"""
+
+    def __init__(self, completions: FakeCompletions):
+        self.chat = SimpleNamespace(completions=completions)
+
+    def with_options(self, **kwargs):
+        return self
+
+
+class TestQuestionFanout(unittest.TestCase):
+    """Tests for parallel per-category question generation"""
+
+    tech_stack = ["Python", "React", "MySQL", "AWS", "Git"]
+
+    def make_manager(self, completions: FakeCompletions) -> ConversationManager:
+        env = patch.dict(os.environ, {"GROQ_API_KEY": "test-key"})
+        groq = patch("src.groq_client.Groq")
+        timeout = patch.object(config, "TECH_QUESTION_BRANCH_TIMEOUT_SECONDS", 0.3)
+        for patcher in (env, groq, timeout):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        manager = ConversationManager(response_cache=None)
+        manager.groq_client.client = FakeGroq(completions)
+        manager.candidate_data["tech_stack"] = list(self.tech_stack)
+        return manager
+
+    def test_questions_stream_per_category_and_are_capped(self):
+        manager = self.make_manager(FakeCompletions())
+        updates = []
+        response = manager.generate_technical_questions(on_update=updates.append)
+
+        self.assertEqual(len(updates), config.MAX_TECHNICAL_QUESTIONS - config.MIN_TECHNICAL_QUESTIONS + 1)
+        self.assertIn("Generating more questions...", updates[0])
+        self.assertIn(f"{config.MIN_TECHNICAL_QUESTIONS}. ", updates[0])
+        self.assertIn(f"{config.MAX_TECHNICAL_QUESTIONS}. ", response)
+        self.assertNotIn(f"{config.MAX_TECHNICAL_QUESTIONS + 1}. ", response)
+        self.assertNotIn("**", response)
+
+    def test_streamed_questions_are_kept_in_final_message(self):
+        manager = self.make_manager(FakeCompletions(delays={"Tools": 2}))
+        updates = []
+        response = manager.generate_technical_questions(on_update=updates.append)
+
+        for update in updates:
+            for line in update.splitlines():
+                if line[:1].isdigit():
+                    self.assertIn(line, response)
+
+    def test_slow_branches_are_filled_from_reserve_within_deadline(self):
+        slow = {"Frontend": 2, "Databases": 2, "Cloud": 2, "Tools": 2}
+        completions = FakeCompletions(delays=slow)
+        manager = self.make_manager(completions)
+
+        start = time.monotonic()
+        with self.assertLogs("src.groq_client", level="WARNING"):
+            response = manager.generate_technical_questions()
+
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertIn(f"{config.MIN_TECHNICAL_QUESTIONS}. ", response)
+        self.assertIn("How do you debug production issues?", response)
+        self.assertNotIn("Full question one", response)
+
+    def test_failed_branches_fall_back_to_single_request_without_partials(self):
+        failing = {"Programming Languages", "Frontend", "Databases", "Cloud", "Tools", "General"}
+        manager = self.make_manager(FakeCompletions(failing=failing))
+        updates = []
+
+        with self.assertLogs("src.groq_client", level="WARNING"):
+            response = manager.generate_technical_questions(on_update=updates.append)
+
+        self.assertEqual(updates, [])
+        self.assertIn("Full question one", response)
+
+    def test_overflow_categories_are_merged_not_dropped(self):
+        completions = FakeCompletions()
+        with patch.dict(os.environ, {"GROQ_API_KEY": "test-key"}), patch("src.groq_client.Groq"), \
+                patch.object(config, "MAX_TECHNICAL_QUESTIONS", 3):
+            client = GroqClient()
+            client.client = FakeGroq(completions)
+            list(client.stream_technical_questions(self.tech_stack))
+
+        category_prompts = [prompt for prompt in completions.prompts if not prompt.startswith("Category: General")]
+        prompts = " ".join(category_prompts)
+        self.assertEqual(len(category_prompts), 3)
+        for tech in self.tech_stack:
+            self.assertIn(tech, prompts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+from unittest.mock import patch
+
+from src.response_cache import ResponseCache
+from src.conversation_manager import ConversationManager
+
+
+class TestResponseCacheEligibility(unittest.TestCase):
+    """Tests for which messages may be cached"""
+
+    def setUp(self):
+        self.cache = ResponseCache()
+        self.cache.seed("Is this timed?", "technical_questions", "No time limit.")
+        self.cache.seed("Can I answer later?", "technical_questions", "Please answer before ending.")
+        self.candidate_data = {"full_name": "Alice Smith", "email": "alice@example.com", "tech_stack": ["Django", "Go"]}
+
+    def test_seeded_questions_and_near_duplicates_are_eligible(self):
+        self.assertTrue(self.cache.is_eligible("Is this timed?", "technical_questions"))
+        self.assertTrue(self.cache.is_eligible("so is this timed", "technical_questions"))
+        self.assertTrue(self.cache.is_eligible("Can I answer later?", "technical_questions"))
+
+    def test_process_topic_questions_are_eligible_in_greeting(self):
+        self.assertTrue(self.cache.is_eligible("How long will the interview take?", "greeting"))
+        self.assertTrue(self.cache.is_eligible("what is the role", "greeting"))
+
+    def test_only_seeded_questions_are_eligible_in_technical_stage(self):
+        self.assertFalse(self.cache.is_eligible("How long will the interview take?", "technical_questions"))
+        self.assertFalse(self.cache.is_eligible("Is this not timed?", "technical_questions"))
+
+    def test_follow_up_questions_are_not_eligible(self):
+        messages = [
+            "Can you repeat that?", "Did I get that right?", "How did I do?",
+            "Can you explain the last one?", "What do you mean by that?", "Is that correct?",
+            "What does the second question mean?", "Can you rephrase Q2?"
+        ]
+        for stage in ("greeting", "technical_questions"):
+            for message in messages:
+                with self.subTest(stage=stage, message=message):
+                    self.assertFalse(self.cache.is_eligible(message, stage))
+
+    def test_questions_without_process_topic_are_not_eligible(self):
+        self.assertFalse(self.cache.is_eligible("Would a B-tree index help here?", "greeting"))
+        self.assertFalse(self.cache.is_eligible("Would a B-tree index help here?", "technical_questions"))
+
+    def test_info_collection_stage_is_not_eligible(self):
+        self.assertFalse(self.cache.is_eligible("Is this timed?", "collecting_info"))
+
+    def test_personal_messages_are_not_eligible(self):
+        self.assertFalse(self.cache.is_eligible("What is my score?", "technical_questions"))
+        self.assertFalse(self.cache.is_eligible("Is alice@example.com used for the interview?", "greeting"))
+        self.assertFalse(self.cache.is_eligible("Will you contact 5551234567?", "greeting"))
+        self.assertFalse(self.cache.is_eligible("Does this role use Django?", "greeting", self.candidate_data))
+
+    def test_short_candidate_values_match_whole_words_only(self):
+        self.assertTrue(self.cache.is_eligible("Is it good to take notes?", "greeting", self.candidate_data))
+
+    def test_replies_mentioning_candidate_data_are_not_stored(self):
+        stored = self.cache.put("What is the role?", "greeting", "Alice Smith, it's a backend role!", self.candidate_data)
+        self.assertFalse(stored)
+        self.assertIsNone(self.cache.get("What is the role?", "greeting"))
+
+
+class TestResponseCacheLookup(unittest.TestCase):
+    """Tests for exact and near-duplicate lookup, TTL and LRU eviction"""
+
+    def test_exact_and_near_duplicate_hits(self):
+        cache = ResponseCache()
+        cache.put("How long does the interview take?", "greeting", "About 10 minutes.")
+        self.assertEqual(cache.get("how long does the INTERVIEW take", "greeting"), "About 10 minutes.")
+        self.assertEqual(cache.get("So how long does the interview take?", "greeting"), "About 10 minutes.")
+        stats = cache.get_stats()
+        self.assertEqual(stats["exact_hits"], 1)
+        self.assertEqual(stats["similar_hits"], 1)
+
+    def test_negation_does_not_match(self):
+        cache = ResponseCache()
+        cache.put("Is the interview timed?", "greeting", "No time limit.")
+        self.assertIsNone(cache.get("Is the interview not timed?", "greeting"))
+
+    def test_stages_are_separate(self):
+        cache = ResponseCache()
+        cache.seed("Is this timed?", "technical_questions", "No time limit.")
+        cache.put("Is the interview timed?", "greeting", "No time limit.")
+        self.assertIsNone(cache.get("Is the interview timed?", "technical_questions"))
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("What is the role?", "greeting", "a")
+        cache.put("What is the team?", "greeting", "b")
+        cache.get("What is the role?", "greeting")
+        cache.put("What is the company?", "greeting", "c")
+        self.assertEqual(cache.get("What is the role?", "greeting"), "a")
+        self.assertIsNone(cache.get("What is the team?", "greeting"))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_ttl_expiry_keeps_seeded_answers(self):
+        cache = ResponseCache(ttl_seconds=60)
+        cache.seed("Is this timed?", "technical_questions", "No time limit.")
+        cache.put("Can we pause the interview?", "greeting", "Yes.")
+        with patch("src.response_cache.time.time", return_value=10 ** 12):
+            self.assertIsNone(cache.get("Can we pause the interview?", "greeting"))
+            self.assertEqual(cache.get("Is this timed?", "technical_questions"), "No time limit.")
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+
+    def test_explicit_zero_settings_are_respected(self):
+        cache = ResponseCache(max_entries=0, similarity_threshold=0.0)
+        self.assertEqual(cache.max_entries, 0)
+        self.assertEqual(cache.similarity_threshold, 0.0)
+        cache.put("What is the role?", "greeting", "a")
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+
+class TestConversationManagerCaching(unittest.TestCase):
+    """Tests for how the conversation manager uses the response cache"""
+
+    def setUp(self):
+        patcher = patch("src.conversation_manager.GroqClient")
+        self.addCleanup(patcher.stop)
+        groq_client = patcher.start().return_value
+        groq_client.check_conversation_end.return_value = False
+        groq_client.is_error_response.return_value = False
+        groq_client.answer_process_question.return_value = "The role is a software engineering position."
+        groq_client.get_response.return_value = "Good question Alice! Q2 asks about Django ORM."
+        self.groq_client = groq_client
+        self.cache = ResponseCache()
+        self.cache.seed("Is this timed?", "technical_questions", "There is no time limit.")
+
+    def make_manager(self, name: str, stage: str = "technical_questions") -> ConversationManager:
+        manager = ConversationManager(response_cache=self.cache)
+        manager.conversation_stage = stage
+        manager.technical_questions_generated = stage == "technical_questions"
+        manager.candidate_data = {"full_name": name, "tech_stack": ["Django"]}
+        return manager
+
+    def test_seeded_process_question_is_not_recorded(self):
+        manager = self.make_manager("Alice")
+        self.assertEqual(manager.process_message("Is this timed?"), "There is no time limit.")
+        self.groq_client.get_response.assert_not_called()
+        self.assertNotIn("technical_responses", manager.candidate_data)
+
+    def test_greeting_process_question_uses_context_free_call(self):
+        self.make_manager("Alice", "greeting").process_message("What is the role?")
+        self.make_manager("Bob", "greeting").process_message("what is the role")
+        self.groq_client.answer_process_question.assert_called_once_with("What is the role?")
+        self.groq_client.get_response.assert_not_called()
+
+    def test_follow_ups_and_question_shaped_answers_are_recorded_and_not_cached(self):
+        for message in ("What does the second question mean?", "Can you repeat that?", "Would a B-tree index help here?"):
+            alice = self.make_manager("Alice")
+            alice.process_message(message)
+            self.assertEqual(alice.candidate_data["technical_responses"][0]["response"], message)
+
+        self.assertEqual(self.groq_client.get_response.call_count, 3)
+        self.groq_client.answer_process_question.assert_not_called()
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
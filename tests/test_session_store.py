@@ -0,0 +1,165 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.session_store import SessionStore
+
+OWNER = "a" * 32
+
+
+class TestSessionStore(unittest.TestCase):
+    """Tests for session eviction, rehydration and finalization"""
+
+    def setUp(self):
+        patcher = patch("src.conversation_manager.GroqClient")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(temp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+
+        self.store = SessionStore(snapshot_dir="data/sessions", max_sessions=2)
+
+    def start_technical_questions(self, manager):
+        manager.candidate_data.update({"full_name": "Alice", "email": "alice@example.com"})
+        manager.conversation_stage = "technical_questions"
+        manager.technical_questions_generated = True
+
+    def read_candidate_file(self, manager):
+        with open(f"data/candidate_{manager.conversation_id}.json") as f:
+            return json.load(f)["candidate_data"]
+
+    def test_least_recently_used_session_is_evicted_first(self):
+        first, _ = self.store.create_session(OWNER)
+        second, _ = self.store.create_session(OWNER)
+        third, _ = self.store.create_session(OWNER)
+        self.store.get(first, OWNER)
+
+        self.assertEqual(self.store.sweep(), 1)
+        self.assertTrue(os.path.exists(self.store.snapshot_path(second)))
+        self.assertFalse(os.path.exists(self.store.snapshot_path(first)))
+        self.assertFalse(os.path.exists(self.store.snapshot_path(third)))
+
+    def test_idle_session_is_rehydrated_transparently(self):
+        session_id, manager = self.store.create_session(OWNER)
+        manager.conversation_stage = "collecting_info"
+        manager.candidate_data["full_name"] = "Alice"
+        self.store._sessions[session_id]["last_activity"] -= self.store.idle_timeout_seconds + 1
+
+        self.assertEqual(self.store.sweep(), 1)
+        restored = self.store.get(session_id, OWNER)
+
+        self.assertIsNot(restored, manager)
+        self.assertEqual(restored.conversation_stage, "collecting_info")
+        self.assertEqual(restored.candidate_data, {"full_name": "Alice"})
+        self.assertFalse(os.path.exists(self.store.snapshot_path(session_id)))
+
+    def test_session_in_use_is_not_evicted(self):
+        store = SessionStore(snapshot_dir="data/sessions", max_sessions=1)
+        session_id, _ = store.create_session(OWNER)
+
+        with store.use(session_id, OWNER) as manager:
+            store.create_session(OWNER)
+            store.sweep()
+            self.assertFalse(store.evict(session_id))
+            manager.conversation_stage = "collecting_info"
+
+        store.sweep()
+        store.evict(session_id)
+        self.assertEqual(store.get(session_id, OWNER).conversation_stage, "collecting_info")
+
+    def test_other_owner_must_confirm_email(self):
+        session_id, manager = self.store.create_session(OWNER)
+        manager.candidate_data["email"] = "alice@example.com"
+        intruder = "b" * 32
+
+        self.assertIsNone(self.store.get(session_id, intruder))
+        self.assertIsNone(self.store.claim(session_id, intruder, "bob@example.com"))
+        self.assertIs(self.store.claim(session_id, intruder, " Alice@Example.com "), manager)
+        self.assertIsNone(self.store.get(session_id, OWNER))
+
+    def test_claim_attempts_are_limited(self):
+        session_id, manager = self.store.create_session(OWNER)
+        manager.candidate_data["email"] = "alice@example.com"
+
+        with patch("config.SESSION_MAX_CLAIM_ATTEMPTS", 2):
+            self.assertTrue(self.store.is_resumable(session_id))
+            self.store.claim(session_id, "b" * 32, "x@example.com")
+            self.store.claim(session_id, "b" * 32, "y@example.com")
+            self.assertFalse(self.store.is_resumable(session_id))
+            self.assertIsNone(self.store.claim(session_id, "b" * 32, "alice@example.com"))
+
+    def test_sessions_without_email_are_not_resumable(self):
+        session_id, _ = self.store.create_session(OWNER)
+        self.assertFalse(self.store.is_resumable(session_id))
+        self.assertFalse(self.store.is_resumable("../../etc/passwd"))
+
+    def test_finalization_saves_latest_answers_on_every_changed_eviction(self):
+        session_id, _ = self.store.create_session(OWNER)
+        with self.store.use(session_id, OWNER) as manager:
+            self.start_technical_questions(manager)
+        self.store.evict(session_id)
+        self.assertNotIn("technical_responses", self.read_candidate_file(manager))
+
+        with self.store.use(session_id, OWNER) as manager:
+            manager.candidate_data["technical_responses"] = [{"response": "Closures capture scope"}]
+        self.store.evict(session_id)
+
+        self.assertEqual(self.read_candidate_file(manager)["technical_responses"][0]["response"], "Closures capture scope")
+        self.assertEqual(self.store.get_stats()["finalized"], 2)
+
+        self.store.get(session_id, OWNER)
+        self.store.evict(session_id)
+        self.assertEqual(self.store.get_stats()["finalized"], 2)
+
+    def test_failed_save_is_retried_on_next_eviction(self):
+        session_id, _ = self.store.create_session(OWNER)
+        with self.store.use(session_id, OWNER) as manager:
+            self.start_technical_questions(manager)
+
+        with patch("src.session_store.save_candidate_data", side_effect=OSError("disk full")):
+            with self.assertLogs("src.session_store", level="WARNING"):
+                self.store.evict(session_id)
+        self.assertIn(session_id, self.store._sessions)
+        self.assertTrue(self.store._sessions[session_id]["dirty"])
+
+        self.store.evict(session_id)
+        self.assertEqual(self.read_candidate_file(manager)["full_name"], "Alice")
+        self.assertEqual(self.store.get_stats()["finalized"], 1)
+
+    def test_unchanged_reruns_do_not_rewrite_candidate_file(self):
+        session_id, _ = self.store.create_session(OWNER)
+        with self.store.use(session_id, OWNER) as manager:
+            self.start_technical_questions(manager)
+        self.store.evict(session_id)
+
+        with self.store.use(session_id, OWNER):
+            pass
+        with patch("src.session_store.save_candidate_data") as save:
+            self.store.evict(session_id)
+        save.assert_not_called()
+        self.assertEqual(self.store.get_stats()["finalized"], 1)
+
+    def test_reset_starts_a_new_candidate_file(self):
+        session_id, _ = self.store.create_session(OWNER)
+        with self.store.use(session_id, OWNER) as manager:
+            self.start_technical_questions(manager)
+            self.store.finalize(session_id)
+            first_conversation = manager.conversation_id
+            manager.reset_conversation()
+            self.start_technical_questions(manager)
+            manager.candidate_data["full_name"] = "Bob"
+        self.store.evict(session_id)
+
+        self.assertNotEqual(manager.conversation_id, first_conversation)
+        self.assertTrue(os.path.exists(f"data/candidate_{first_conversation}.json"))
+        self.assertEqual(self.read_candidate_file(manager)["full_name"], "Bob")
+
+
+if __name__ == "__main__":
+    unittest.main()